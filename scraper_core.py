@@ -0,0 +1,738 @@
+"""
+Product Management Internship Scraper core
+Shared fetching, parsing, diffing and notification logic for the scraper entry points
+"""
+
+import os
+import json
+import asyncio
+import hashlib
+import aiohttp
+import re
+from datetime import datetime, timedelta
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Set, Iterator, Tuple, Any, Mapping
+
+# The mail and template modules are only imported when a notification is actually sent
+if TYPE_CHECKING:
+    import jinja2
+    import smtplib
+    from email.mime.multipart import MIMEMultipart
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump whenever parsing changes so unchanged READMEs are re-parsed on the next run
+PARSER_VERSION = 1
+
+# Transient HTTP failures are retried with exponential backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 5
+BACKOFF_FACTOR = 0.5
+
+# Queued notifications are emailed once the batch is this large or its oldest entry this old
+BATCH_MAX = 10
+BATCH_MAX_AGE = timedelta(hours=1)
+
+# Patterns are compiled once at import instead of on every parsed line
+APPLY_RE = re.compile(r'\[apply\]\((https?://[^)]+)\)', re.IGNORECASE)
+MD_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+MD_LINK_SUB_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)')
+MD_LINK_ANY_TEXT_RE = re.compile(r'\[([^\]]*)\]\(([^)]+)\)')
+BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+
+# Jinja2 sources for the HTML notification bodies, compiled once by get_html_template()
+BATCH_HTML_TEMPLATE = """
+        <html>
+        <head>
+            <style>
+                body { font-family: Arial, sans-serif; margin: 20px; }
+                .header { background-color: #f8f9fa; padding: 15px; border-left: 4px solid #007bff; }
+                .listing { margin: 15px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
+                .company { font-weight: bold; font-size: 16px; color: #333; }
+                .position { font-size: 14px; color: #666; margin: 5px 0; }
+                .location { font-size: 12px; color: #888; }
+                .apply-btn { 
+                    background-color: #007bff; 
+                    color: white; 
+                    padding: 8px 16px; 
+                    text-decoration: none; 
+                    border-radius: 3px; 
+                    display: inline-block;
+                    margin-top: 10px;
+                }
+                .footer { margin-top: 20px; font-size: 12px; color: #666; }
+            </style>
+        </head>
+        <body>
+            <div class="header">
+                <h2>🚀 New Product Management Internship Listings</h2>
+                <p>Found {{ count }} new internship opportunity(ies)!</p>
+            </div>
+            {% for listing in listings %}
+            <div class="listing">
+                <div class="company">
+                    {% if listing.company_url %}<a href="{{ listing.company_url }}" target="_blank">{{ listing.company }}</a>{% else %}{{ listing.company }}{% endif %}
+                </div>
+                <div class="position">{{ listing.position }}</div>
+                <div class="location">📍 {{ listing.location }} • {{ listing.work_model }} • Posted: {{ listing.date_posted }}</div>
+                {% if listing.apply_link %}<a href="{{ listing.apply_link }}" class="apply-btn" target="_blank">Apply Now</a>{% endif %}
+            </div>
+            {% endfor %}
+            <div class="footer">
+                <p>Source: <a href="https://github.com/jobright-ai/2025-Product-Management-Internship">GitHub Repository</a></p>
+                <p>This alert was generated automatically.</p>
+            </div>
+        </body>
+        </html>
+        """
+
+# Compact template used when a run finds exactly one new listing
+SINGLE_HTML_TEMPLATE = """<html><body style="font-family: Arial, sans-serif;">
+<p><b>{% if listing.company_url %}<a href="{{ listing.company_url }}">{{ listing.company }}</a>{% else %}{{ listing.company }}{% endif %}</b> posted a new internship:</p>
+<p><b>{{ listing.position }}</b><br>📍 {{ listing.location }} • {{ listing.work_model }} • Posted: {{ listing.date_posted }}</p>
+{% if listing.apply_link %}<p><a href="{{ listing.apply_link }}">Apply Now</a></p>{% endif %}
+</body></html>
+"""
+
+HTML_TEMPLATES = {
+    'batch': BATCH_HTML_TEMPLATE,
+    'single': SINGLE_HTML_TEMPLATE
+}
+
+# Plain text bodies, filled in with str.format
+TEXT_HEADER_TEMPLATE = "New Product Management Internship Listings ({count} found):\n\n"
+
+TEXT_LISTING_TEMPLATE = (
+    "• {company} - {position}\n"
+    "  Location: {location} ({work_model})\n"
+    "  Posted: {date_posted}\n"
+    "{apply_line}"
+    "\n"
+)
+
+@lru_cache(maxsize=None)
+def get_html_template(name: str) -> 'jinja2.Template':
+    """Compile an HTML email template on first use and reuse it for every later render"""
+    import jinja2
+    
+    return jinja2.Template(HTML_TEMPLATES[name], autoescape=True)
+
+class InternshipScraper:
+    def __init__(self, format: str = 'table'):
+        if format not in ('table', 'list'):
+            raise ValueError(f"Unsupported listing format: {format}")
+        self.format = format
+        self.repo_url = "https://api.github.com/repos/jobright-ai/2025-Product-Management-Internship"
+        self.raw_readme_url = "https://raw.githubusercontent.com/jobright-ai/2025-Product-Management-Internship/master/README.md"
+        self.data_file = "previous_listings.json"
+        self.readme_cache_file = "readme_cache.json"
+        self.digest_file = "readme_digest.json"
+        self.pending_file = "pending_notifications.json"
+        self.readme_cache = {}
+        self.readme_not_modified = False
+        self.github_token = os.getenv('GITHUB_TOKEN')
+        self.headers = {
+            'Accept': 'application/vnd.github.v3+json'
+        }
+        if self.github_token:
+            self.headers['Authorization'] = f'token {self.github_token}'
+        
+    async def fetch_readme_content(self, session: aiohttp.ClientSession) -> str:
+        """Fetch the current README content, revalidating the cached copy via ETag"""
+        self.readme_cache = self.load_readme_cache()
+        self.readme_not_modified = False
+        
+        headers = {}
+        if self.readme_cache.get('etag'):
+            headers['If-None-Match'] = self.readme_cache['etag']
+        if self.readme_cache.get('last_modified'):
+            headers['If-Modified-Since'] = self.readme_cache['last_modified']
+        
+        try:
+            status, response_headers, body = await self._get_with_retry(session, self.raw_readme_url, headers)
+            if status == 304 and self.readme_cache.get('body'):
+                self.readme_not_modified = True
+                return self.readme_cache['body']
+            
+            self.readme_cache = {
+                'etag': response_headers.get('ETag'),
+                'last_modified': response_headers.get('Last-Modified'),
+                'body': body
+            }
+            return body
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error fetching README: {e}")
+            return ""
+    
+    async def _get_with_retry(self, session: aiohttp.ClientSession, url: str, headers: Dict[str, str]) -> Tuple[int, Mapping[str, str], str]:
+        """GET a URL, retrying connection errors and 429/5xx responses with exponential backoff"""
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                        response.raise_for_status()
+                        return response.status, response.headers.copy(), await response.text()
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+                if attempt == MAX_RETRIES:
+                    raise
+            await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
+    
+    def load_readme_cache(self) -> Dict[str, str]:
+        """Load the cached README body and its ETag/Last-Modified validators"""
+        if os.path.exists(self.readme_cache_file):
+            try:
+                return self._read_json(self.readme_cache_file)
+            except (json.JSONDecodeError, IOError):
+                return {}
+        return {}
+    
+    def save_readme_cache(self):
+        """Save the README body and validators for the next conditional request"""
+        self._write_json(self.readme_cache_file, self.readme_cache)
+    
+    def content_digest(self, readme_content: str) -> str:
+        """Hash the README together with the parser format and version that produced the saved listings"""
+        digest = hashlib.blake2b(f"{self.format}:{PARSER_VERSION}\n".encode('utf-8'), digest_size=16)
+        digest.update(readme_content.encode('utf-8'))
+        return digest.hexdigest()
+    
+    def load_last_digest(self) -> str:
+        """Load the digest of the README content parsed by the last run"""
+        if os.path.exists(self.digest_file):
+            try:
+                return self._read_json(self.digest_file).get('last_digest', '')
+            except (json.JSONDecodeError, IOError, AttributeError):
+                return ''
+        return ''
+    
+    def save_last_digest(self, digest: str):
+        """Save the digest of the README content parsed by this run"""
+        self._write_json(self.digest_file, {'last_digest': digest})
+    
+    def parse_internship_listings(self, readme_content: str) -> List[Dict]:
+        """Parse internship listings from README content in the configured format"""
+        if self.format == 'list':
+            return self._parse_list(readme_content)
+        return self._parse_table(readme_content)
+    
+    def _parse_table(self, readme_content: str) -> List[Dict]:
+        """Parse listings from a markdown table of Company | Job Title | Location | Work Model | Date Posted"""
+        listings = []
+        
+        in_table = False
+        found_date = datetime.now().isoformat()
+        
+        for line in readme_content.split('\n'):
+            line = line.strip()
+            
+            # Look for table start marker
+            if 'TABLE_START' in line or (line.startswith('| Company') and 'Job Title' in line):
+                in_table = True
+                continue
+            
+            # Look for table end marker
+            if 'TABLE_END' in line:
+                in_table = False
+                break
+            
+            # Skip header separator line
+            if line.startswith('| -') or line.startswith('|--'):
+                continue
+            
+            # Parse table rows when in table section
+            if not in_table:
+                continue
+            
+            # One split both checks the row shape and yields the cells: a row with
+            # leading/trailing | and 5+ columns splits into 7+ parts with empty ends
+            cells = line.split('|')
+            if len(cells) < 7 or cells[0] != '' or cells[-1] != '':
+                continue
+            
+            try:
+                # Company, Job Title, Location, Work Model, Date Posted
+                cells = [cell.strip() for cell in cells[1:-1]]
+                company_cell = cells[0]
+                job_title_cell = cells[1]
+                location = cells[2]
+                work_model = cells[3]
+                date_posted = cells[4]
+                
+                # Extract company name and URL
+                company_info = self.extract_company_info(company_cell)
+                job_info = self.extract_job_info(job_title_cell)
+                
+                # Skip if essential info is missing
+                if not company_info['name'] or not job_info['title']:
+                    continue
+                
+                # Skip separator rows with arrows (↳)
+                if company_info['name'] == '↳' or company_info['name'] == '':
+                    # This is a continuation row, use previous company
+                    if listings:
+                        company_info['name'] = listings[-1]['company']
+                    else:
+                        continue
+                
+                listing = {
+                    'company': company_info['name'],
+                    'position': job_info['title'],
+                    'location': location,
+                    'work_model': work_model,
+                    'date_posted': date_posted,
+                    'apply_link': job_info['link'],
+                    'company_url': company_info['url'],
+                    'found_date': found_date,
+                    '_key': f"{company_info['name']}||{job_info['title']}"
+                }
+                listings.append(listing)
+                
+            except Exception as e:
+                print(f"Error parsing line: {line[:50]}... - {e}")
+                continue
+        
+        return listings
+    
+    def _parse_list(self, readme_content: str) -> List[Dict]:
+        """Parse listings from markdown list items like * Company - Position - Location"""
+        listings = []
+        found_date = datetime.now().isoformat()
+        split_lines = readme_content.splitlines()
+        
+        for i, line in enumerate(split_lines):
+            line = line.strip()
+            # Require a real bullet so **bold** lines are not taken as listings
+            if not line.startswith('* '):
+                continue
+            
+            # Drop inline apply links so their text doesn't end up in a field; only
+            # company, position and location are used, so stop splitting after them
+            item = APPLY_RE.sub('', line[2:]).strip()
+            parts = item.split(' - ', 3)
+            if len(parts) < 2:
+                continue
+            
+            company = self.clean_cell_content(parts[0])
+            position = self.clean_cell_content(parts[1])
+            location = self.clean_cell_content(parts[2]) if len(parts) > 2 else "Not specified"
+            
+            # Skip if essential info is missing
+            if not company or not position:
+                continue
+            
+            listing = {
+                'company': company,
+                'position': position,
+                'location': location,
+                'apply_link': self.find_apply_link(line, split_lines, i),
+                'found_date': found_date,
+                '_key': f"{company}||{position}"
+            }
+            listings.append(listing)
+        
+        return listings
+    
+    def extract_company_info(self, company_cell: str) -> Dict[str, str]:
+        """Extract company name and URL from cell like **[TikTok](https://www.tiktok.com)**"""
+        # Remove bold formatting
+        cell = company_cell.replace('**', '')
+        
+        # Extract markdown link [Company Name](URL)
+        link_match = MD_LINK_RE.search(cell)
+        if link_match:
+            return {
+                'name': link_match.group(1).strip(),
+                'url': link_match.group(2).strip()
+            }
+        else:
+            # No link, just plain text
+            return {
+                'name': cell.strip(),
+                'url': ''
+            }
+    
+    def extract_job_info(self, job_cell: str) -> Dict[str, str]:
+        """Extract job title and application URL from job cell"""
+        # Remove bold formatting
+        cell = job_cell.replace('**', '')
+        
+        # Extract markdown link [Job Title](URL)
+        link_match = MD_LINK_RE.search(cell)
+        if link_match:
+            return {
+                'title': link_match.group(1).strip(),
+                'link': link_match.group(2).strip()
+            }
+        else:
+            # No link, just plain text
+            return {
+                'title': cell.strip(),
+                'link': ''
+            }
+    
+    def clean_cell_content(self, cell: str) -> str:
+        """Clean markdown formatting from table cell content"""
+        # Remove [text](link) format but keep text
+        cell = MD_LINK_SUB_RE.sub(r'\1', cell)
+        # Remove **bold** formatting
+        cell = BOLD_RE.sub(r'\1', cell)
+        # Remove other markdown formatting
+        cell = cell.replace('**', '').replace('*', '').replace('`', '')
+        return cell.strip()
+    
+    def extract_link_from_cells(self, cells: List[str]) -> str:
+        """Extract application link from table cells"""
+        for cell in cells:
+            # Look for markdown links
+            link_match = MD_LINK_ANY_TEXT_RE.search(cell)
+            if link_match:
+                link_text = link_match.group(1).lower()
+                link_url = link_match.group(2)
+                # Check if it's an application link
+                if 'apply' in link_text or 'job' in link_text or link_url.startswith('http'):
+                    return link_url
+        return ""
+    
+    def parse_alternative_format(self, readme_content: str) -> List[Dict]:
+        """Alternative parsing for different formats"""
+        listings = []
+        found_date = datetime.now().isoformat()
+        
+        for line in readme_content.split('\n'):
+            line = line.strip()
+            # Look for lines that mention companies and positions
+            if ('intern' in line.lower() and 
+                ('|' in line or '-' in line) and 
+                len(line) > 20 and
+                not line.startswith('#')):
+                
+                # Try to extract company and position info
+                parts = []
+                if '|' in line:
+                    parts = [p.strip() for p in line.split('|') if p.strip()]
+                elif ' - ' in line:
+                    parts = [p.strip() for p in line.split(' - ') if p.strip()]
+                
+                if len(parts) >= 2:
+                    company = self.clean_cell_content(parts[0])
+                    position = self.clean_cell_content(parts[1])
+                    location = self.clean_cell_content(parts[2]) if len(parts) > 2 else "Not specified"
+                    
+                    if company and position and len(company) > 1 and len(position) > 5:
+                        listing = {
+                            'company': company,
+                            'position': position,
+                            'location': location,
+                            'apply_link': self.extract_link_from_cells(parts),
+                            'found_date': found_date,
+                            '_key': f"{company}||{position}"
+                        }
+                        listings.append(listing)
+        
+        return listings
+    
+    def find_apply_link(self, line: str, split_lines: List[str], i: int) -> str:
+        """Find application link associated with the listing at split_lines[i]"""
+        # Check the line itself first
+        match = APPLY_RE.search(line)
+        if match:
+            return match.group(1)
+        
+        # If not found in line, look at the lines that follow it; a link after the
+        # next list item belongs to that item, not this one
+        for context_line in split_lines[i+1:i+3]:
+            if context_line.strip().startswith('* '):
+                break
+            match = APPLY_RE.search(context_line)
+            if match:
+                return match.group(1)
+        
+        return ""
+    
+    def load_previous_listings(self) -> List[Dict]:
+        """Load previously found listings from file"""
+        if os.path.exists(self.data_file):
+            try:
+                listings = self._read_json(self.data_file)
+            except (json.JSONDecodeError, IOError):
+                return []
+            
+            # Backfill the comparison key for listings saved before it existed
+            for listing in listings:
+                if '_key' not in listing:
+                    listing['_key'] = f"{listing['company']}||{listing['position']}"
+            return listings
+        return []
+    
+    def save_listings(self, listings: List[Dict]):
+        """Save current listings to file"""
+        self._write_json(self.data_file, listings)
+    
+    def _read_json(self, path: str) -> Any:
+        """Read a JSON file, using orjson when it is installed"""
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def _write_json(self, path: str, data: Any):
+        """Write a JSON file with 2-space indentation, using orjson when it is installed"""
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            return
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+    
+    def find_new_listings(self, current_listings: List[Dict], previous_listings: List[Dict]) -> List[Dict]:
+        """Find new listings by comparing current with previous"""
+        # Compare on the key computed once when each listing was parsed
+        previous_ids = {listing['_key'] for listing in previous_listings}
+        return [listing for listing in current_listings if listing['_key'] not in previous_ids]
+    
+    def load_pending_notifications(self) -> List[Dict]:
+        """Load listings queued for the next notification email"""
+        if os.path.exists(self.pending_file):
+            try:
+                return self._read_json(self.pending_file)
+            except (json.JSONDecodeError, IOError):
+                return []
+        return []
+    
+    def save_pending_notifications(self, pending: List[Dict]):
+        """Replace the notification queue atomically so a crash never leaves it half written"""
+        tmp_file = f"{self.pending_file}.tmp"
+        self._write_json(tmp_file, pending)
+        os.replace(tmp_file, self.pending_file)
+    
+    def email_configured(self) -> bool:
+        """Check whether the Gmail credentials and recipient are all set"""
+        return all([os.getenv('GMAIL_USERNAME'), os.getenv('GMAIL_APP_PASSWORD'), os.getenv('RECIPIENT_EMAIL')])
+    
+    def queue_notifications(self, new_listings: List[Dict]):
+        """Append new listings to the notification queue, skipping ones already queued"""
+        # Without credentials the queue could never drain, so drop the notifications
+        if not self.email_configured():
+            print("Email credentials not configured")
+            return
+        
+        pending = self.load_pending_notifications()
+        queued_ids = {listing['_key'] for listing in pending}
+        pending.extend(listing for listing in new_listings if listing['_key'] not in queued_ids)
+        self.save_pending_notifications(pending)
+    
+    def flush_pending_notifications(self):
+        """Email the queued listings once the batch is large or old enough, then drain the queue"""
+        pending = self.load_pending_notifications()
+        if not pending:
+            return
+        
+        # Drop anything queued before the credentials were removed
+        if not self.email_configured():
+            print(f"Email credentials not configured, dropping {len(pending)} pending notification(s)")
+            self.save_pending_notifications([])
+            return
+        
+        oldest = min(datetime.fromisoformat(listing['found_date']) for listing in pending)
+        if len(pending) < BATCH_MAX and datetime.now() - oldest < BATCH_MAX_AGE:
+            print(f"Holding {len(pending)} pending notification(s) for a later batch")
+            return
+        
+        if self.send_email_notification(pending):
+            self.save_pending_notifications([])
+    
+    def send_email_notification(self, new_listings: List[Dict]) -> bool:
+        """Send email notification about new listings"""
+        if not new_listings:
+            return True
+        
+        gmail_username = os.getenv('GMAIL_USERNAME')
+        gmail_password = os.getenv('GMAIL_APP_PASSWORD')
+        recipient_email = os.getenv('RECIPIENT_EMAIL')
+        
+        if not all([gmail_username, gmail_password, recipient_email]):
+            print("Email credentials not configured")
+            return False
+        
+        # A lone listing gets a compact email instead of the batch digest
+        if len(new_listings) == 1:
+            subject, html_body, text_body = self._build_single(new_listings[0])
+        else:
+            subject, html_body, text_body = self._build_batch(new_listings)
+        
+        # Send email
+        try:
+            msg = self._build_msg(subject, html_body, text_body, gmail_username, recipient_email)
+            self._send_messages([msg], gmail_username, gmail_password)
+            
+            print(f"Email sent successfully! Found {len(new_listings)} new listings.")
+            return True
+            
+        except Exception as e:
+            print(f"Error sending email: {e}")
+            return False
+    
+    def _build_single(self, listing: Dict) -> Tuple[str, str, str]:
+        """Build the subject, HTML body and plain text body for a single listing"""
+        subject = f"[Internship Alert] {listing['company']} - {listing['position']}"
+        
+        html_body = get_html_template('single').render(listing=listing)
+        text_body = TEXT_LISTING_TEMPLATE.format(
+            company=listing['company'],
+            position=listing['position'],
+            location=listing['location'],
+            work_model=listing.get('work_model', 'N/A'),
+            date_posted=listing.get('date_posted', 'N/A'),
+            apply_line=f"  Apply: {listing['apply_link']}\n" if listing.get('apply_link') else ''
+        )
+        
+        return subject, html_body, text_body
+    
+    def _build_batch(self, new_listings: List[Dict]) -> Tuple[str, str, str]:
+        """Build the subject, HTML body and plain text body for a batch of listings"""
+        subject = f"[Internship Alert] {len(new_listings)} new listing(s)"
+        
+        html_body = get_html_template('batch').render(listings=new_listings, count=len(new_listings))
+        
+        # Create plain text version
+        text_parts = [TEXT_HEADER_TEMPLATE.format(count=len(new_listings))]
+        text_parts.extend(
+            TEXT_LISTING_TEMPLATE.format(
+                company=listing['company'],
+                position=listing['position'],
+                location=listing['location'],
+                work_model=listing.get('work_model', 'N/A'),
+                date_posted=listing.get('date_posted', 'N/A'),
+                apply_line=f"  Apply: {listing['apply_link']}\n" if listing.get('apply_link') else ''
+            )
+            for listing in new_listings
+        )
+        text_body = "".join(text_parts)
+        
+        return subject, html_body, text_body
+    
+    def _build_msg(self, subject: str, html_body: str, text_body: str, sender: str, recipient: str) -> 'MIMEMultipart':
+        """Build a multipart email with plain text and HTML alternatives"""
+        from email.mime.multipart import MIMEMultipart
+        from email.mime.text import MIMEText
+        
+        msg = MIMEMultipart('alternative')
+        msg['Subject'] = subject
+        msg['From'] = sender
+        msg['To'] = recipient
+        
+        # Add text and HTML parts
+        msg.attach(MIMEText(text_body, 'plain'))
+        msg.attach(MIMEText(html_body, 'html'))
+        return msg
+    
+    @contextmanager
+    def _get_smtp(self, gmail_username: str, gmail_password: str) -> Iterator['smtplib.SMTP']:
+        """Yield a connected and authenticated Gmail SMTP session"""
+        import smtplib
+        
+        server = smtplib.SMTP('smtp.gmail.com', 587)
+        try:
+            server.starttls()
+            server.login(gmail_username, gmail_password)
+            yield server
+        finally:
+            try:
+                server.quit()
+            except smtplib.SMTPServerDisconnected:
+                pass
+    
+    def _send_messages(self, messages: List['MIMEMultipart'], gmail_username: str, gmail_password: str):
+        """Send a batch of messages over one SMTP session, reconnecting once if it drops"""
+        import smtplib
+        
+        pending = list(messages)
+        reconnected = False
+        while pending:
+            try:
+                with self._get_smtp(gmail_username, gmail_password) as server:
+                    while pending:
+                        server.send_message(pending[0])
+                        pending.pop(0)
+            except smtplib.SMTPServerDisconnected:
+                if reconnected:
+                    raise
+                reconnected = True
+    
+    async def run(self):
+        """Main execution function"""
+        print(f"Starting scraper at {datetime.now()}")
+        
+        # Fetch current README content over a pooled keep-alive session
+        async with aiohttp.ClientSession(
+            headers=self.headers,
+            timeout=aiohttp.ClientTimeout(sock_connect=5, sock_read=30),
+            connector=aiohttp.TCPConnector(limit_per_host=64)
+        ) as session:
+            readme_content = await self.fetch_readme_content(session)
+        if not readme_content:
+            print("Failed to fetch README content")
+            # Queued listings still go out once they are old enough
+            self.flush_pending_notifications()
+            return
+        
+        print(f"README content length: {len(readme_content)} characters")
+        
+        # Skip parsing entirely when neither the README nor the parser has changed,
+        # but still let queued notifications go out once they are old enough
+        digest = self.content_digest(readme_content)
+        if digest == self.load_last_digest():
+            if self.readme_not_modified:
+                print("README not modified since last run, skipping parse")
+            else:
+                print("README unchanged, skipping parse")
+                # Still keep the fresh ETag so the next run can get a 304
+                self.save_readme_cache()
+            self.flush_pending_notifications()
+            return
+        
+        print("First 500 characters of README:")
+        print("-" * 50)
+        print(readme_content[:500])
+        print("-" * 50)
+        
+        # Load previous listings
+        previous_listings = self.load_previous_listings()
+        print(f"Previously had {len(previous_listings)} listings")
+        
+        # Parse current listings
+        current_listings = self.parse_internship_listings(readme_content)
+        print(f"Found {len(current_listings)} total listings")
+        
+        # Debug: Show some sample listings
+        if current_listings:
+            print("Sample listings found:")
+            for i, listing in enumerate(current_listings[:3]):  # Show first 3
+                print(f"  {i+1}. {listing['company']} - {listing['position']}")
+        
+        # Find new listings
+        new_listings = self.find_new_listings(current_listings, previous_listings)
+        
+        if new_listings:
+            print(f"Found {len(new_listings)} new listings!")
+            for listing in new_listings:
+                print(f"  - {listing['company']}: {listing['position']}")
+            
+            # Queue notifications so one email covers several polling runs
+            self.queue_notifications(new_listings)
+        else:
+            print("No new listings found")
+        
+        # Save current listings before sending, so a crash after a successful send
+        # can't make the next run report the same listings as new again
+        self.save_listings(current_listings)
+        self.save_readme_cache()
+        self.save_last_digest(digest)
+        
+        self.flush_pending_notifications()
+        print("Scraper completed successfully")
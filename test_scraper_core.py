@@ -0,0 +1,167 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import scraper_core
+from scraper_core import InternshipScraper
+
+
+def make_listing(n, found_date=None):
+    return {
+        'company': f'Company {n}',
+        'position': 'PM Intern',
+        'location': 'NYC',
+        'apply_link': '',
+        'found_date': found_date or datetime.now().isoformat(),
+        '_key': f'Company {n}||PM Intern',
+    }
+
+
+@pytest.fixture
+def queue_scraper(tmp_path, monkeypatch):
+    """Scraper writing its state under tmp_path with email configured and sends recorded"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('GMAIL_USERNAME', 'user@example.com')
+    monkeypatch.setenv('GMAIL_APP_PASSWORD', 'password')
+    monkeypatch.setenv('RECIPIENT_EMAIL', 'recipient@example.com')
+    scraper = InternshipScraper()
+    scraper.sent = []
+    scraper._send_messages = lambda messages, username, password: scraper.sent.extend(messages)
+    return scraper
+
+
+def test_list_format_uses_each_listings_own_apply_link():
+    readme = (
+        "* Acme - PM Intern - NYC\n"
+        "  [Apply](https://a/1)\n"
+        "* Beta - PM Intern - SF\n"
+        "  [Apply](https://b/2)\n"
+    )
+    listings = InternshipScraper(format='list').parse_internship_listings(readme)
+    assert [(l['company'], l['apply_link']) for l in listings] == [
+        ('Acme', 'https://a/1'),
+        ('Beta', 'https://b/2'),
+    ]
+
+
+def test_list_format_listing_without_link_does_not_inherit_neighbours():
+    readme = (
+        "* Acme - PM Intern - NYC\n"
+        "  [Apply](https://a/1)\n"
+        "* Foo - Product Intern\n"
+    )
+    listings = InternshipScraper(format='list').parse_internship_listings(readme)
+    assert [(l['company'], l['apply_link']) for l in listings] == [
+        ('Acme', 'https://a/1'),
+        ('Foo', ''),
+    ]
+
+
+def test_list_format_repeated_item_finds_its_own_link():
+    readme = (
+        "## Featured\n"
+        "* Acme - PM Intern - NYC\n"
+        "\n"
+        "## All\n"
+        "* Acme - PM Intern - NYC\n"
+        "  [Apply](https://a/1)\n"
+    )
+    listings = InternshipScraper(format='list').parse_internship_listings(readme)
+    assert [(l['company'], l['apply_link']) for l in listings] == [
+        ('Acme', ''),
+        ('Acme', 'https://a/1'),
+    ]
+
+
+def test_list_format_inline_apply_link_stays_out_of_location():
+    readme = "* Acme - PM Intern - NYC [Apply](https://a/1)\n"
+    listings = InternshipScraper(format='list').parse_internship_listings(readme)
+    assert [(l['location'], l['apply_link']) for l in listings] == [('NYC', 'https://a/1')]
+
+
+def test_list_format_ignores_bold_lines():
+    readme = (
+        "**Note** - read below - x\n"
+        "* Acme - PM Intern - NYC\n"
+    )
+    listings = InternshipScraper(format='list').parse_internship_listings(readme)
+    assert [l['_key'] for l in listings] == ['Acme||PM Intern']
+
+
+def test_queue_holds_small_recent_batch(queue_scraper):
+    queue_scraper.queue_notifications([make_listing(1)])
+    queue_scraper.flush_pending_notifications()
+    assert queue_scraper.sent == []
+    assert len(queue_scraper.load_pending_notifications()) == 1
+
+
+def test_queue_sends_and_clears_at_batch_max(queue_scraper):
+    queue_scraper.queue_notifications([make_listing(n) for n in range(scraper_core.BATCH_MAX)])
+    queue_scraper.flush_pending_notifications()
+    assert len(queue_scraper.sent) == 1
+    assert queue_scraper.load_pending_notifications() == []
+
+
+def test_queue_sends_when_oldest_exceeds_max_age(queue_scraper):
+    old = (datetime.now() - scraper_core.BATCH_MAX_AGE - timedelta(minutes=1)).isoformat()
+    queue_scraper.queue_notifications([make_listing(1, found_date=old), make_listing(2)])
+    queue_scraper.flush_pending_notifications()
+    assert len(queue_scraper.sent) == 1
+    assert queue_scraper.load_pending_notifications() == []
+
+
+def test_queue_skips_already_queued_keys(queue_scraper):
+    queue_scraper.queue_notifications([make_listing(1), make_listing(2)])
+    queue_scraper.queue_notifications([make_listing(2), make_listing(3)])
+    assert [l['_key'] for l in queue_scraper.load_pending_notifications()] == [
+        'Company 1||PM Intern',
+        'Company 2||PM Intern',
+        'Company 3||PM Intern',
+    ]
+
+
+def test_queue_kept_when_send_fails(queue_scraper):
+    def fail(messages, username, password):
+        raise OSError('connection refused')
+    queue_scraper._send_messages = fail
+    queue_scraper.queue_notifications([make_listing(n) for n in range(scraper_core.BATCH_MAX)])
+    queue_scraper.flush_pending_notifications()
+    assert len(queue_scraper.load_pending_notifications()) == scraper_core.BATCH_MAX
+
+
+def test_queue_dropped_without_credentials(queue_scraper, monkeypatch):
+    queue_scraper.queue_notifications([make_listing(1)])
+    monkeypatch.delenv('GMAIL_APP_PASSWORD')
+    queue_scraper.queue_notifications([make_listing(2)])
+    assert len(queue_scraper.load_pending_notifications()) == 1
+    queue_scraper.flush_pending_notifications()
+    assert queue_scraper.sent == []
+    assert queue_scraper.load_pending_notifications() == []
+
+
+def test_run_flushes_queue_when_fetch_fails(queue_scraper):
+    async def fetch_fails(session):
+        return ""
+    queue_scraper.fetch_readme_content = fetch_fails
+    old = (datetime.now() - scraper_core.BATCH_MAX_AGE - timedelta(minutes=1)).isoformat()
+    queue_scraper.save_pending_notifications([make_listing(1, found_date=old)])
+    asyncio.run(queue_scraper.run())
+    assert len(queue_scraper.sent) == 1
+    assert queue_scraper.load_pending_notifications() == []
+
+
+def test_run_saves_listings_before_sending(queue_scraper):
+    readme = "\n".join(
+        ["| Company | Job Title | Location | Work Model | Date Posted |", "| --- | --- | --- | --- | --- |"]
+        + [f"| Company {n} | PM Intern | NYC | Remote | Oct 05 |" for n in range(scraper_core.BATCH_MAX)]
+    )
+    async def fetch(session):
+        return readme
+    saved_before_send = []
+    queue_scraper.fetch_readme_content = fetch
+    queue_scraper._send_messages = lambda messages, username, password: saved_before_send.append(
+        len(queue_scraper.load_previous_listings())
+    )
+    asyncio.run(queue_scraper.run())
+    assert saved_before_send == [scraper_core.BATCH_MAX]